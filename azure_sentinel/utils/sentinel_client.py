@@ -33,14 +33,17 @@ Microsoft Azure Sentinel Client.
 """
 
 import json
+import random
 import time
-import sys
 import requests
+from requests.adapters import HTTPAdapter
 import datetime
 import hashlib
 import hmac
 import base64
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from netskope.common.utils import add_user_agent
 from enum import Enum
 from binascii import Error
@@ -52,10 +55,16 @@ from .sentinel_constants import (
     RESOURCE,
     API_BASE_URL,
     MAX_RETRIES,
-    RETRY_SLEEP_TIME,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_JITTER,
     MODULE_NAME,
     TARGET_SIZE_MB,
     BATCH_SIZE,
+    CONNECTION_POOL_SIZE,
+    MAX_CONCURRENT_PAGES,
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
 )
 from .sentinel_helper import split_into_size
 
@@ -68,6 +77,20 @@ class DataTypes(Enum):
     WEBTX = "webtx"
 
 
+@lru_cache(maxsize=8)
+def _decode_primary_key(primary_key):
+    """Decode the base64 workspace primary key.
+
+    The decoded key bytes are cached so that they are shared across
+    pages and client instances instead of being re-decoded for every
+    signature. Invalid keys raise and are never cached.
+
+    :param primary_key: The base64 encoded primary key of the workspace
+    :return: The decoded key bytes
+    """
+    return base64.b64decode(primary_key)
+
+
 class AzureSentinelClient:
     """Microsoft Azure Sentinel Client Class."""
 
@@ -95,6 +118,29 @@ class AzureSentinelClient:
         else:
             self.verify_ssl = False
 
+        # Reuse a single session with a tuned connection pool so that
+        # multi-page ingestions reuse warm keep-alive connections instead
+        # of paying a TCP + TLS handshake per page.
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=CONNECTION_POOL_SIZE,
+                pool_maxsize=CONNECTION_POOL_SIZE,
+                pool_block=True,
+            ),
+        )
+        self.workspace_id = (
+            self.configuration.get("workspace_id") or ""
+        ).strip()
+        self.ingest_uri = API_BASE_URL.format(self.workspace_id, RESOURCE)
+        # Fail fast instead of letting a stuck endpoint hang the worker
+        # thread and hold a connection-pool slot indefinitely.
+        self.timeout = (
+            CONNECT_TIMEOUT,
+            self.configuration.get("request_timeout") or READ_TIMEOUT,
+        )
+
     def _build_signature(self, workspace_id, primary_key, date, content_length):
         """Build the required authentication signature for Azure Sentinel.
 
@@ -120,7 +166,7 @@ class AzureSentinelClient:
                 + RESOURCE
             )
             bytes_to_hash = bytes(string_to_hash, encoding="utf-8")
-            decoded_key = base64.b64decode(primary_key)
+            decoded_key = _decode_primary_key(primary_key)
             encoded_hash = base64.b64encode(
                 hmac.new(decoded_key, bytes_to_hash, digestmod=hashlib.sha256).digest()
             ).decode()
@@ -162,6 +208,25 @@ class AzureSentinelClient:
         headers.update({"User-Agent": user_agent})
         return headers
 
+    def _get_retry_delay(self, retry_counter, retry_after=None):
+        """Compute the delay before the next retry attempt.
+
+        Uses bounded exponential backoff with jitter, preferring the
+        Retry-After value received from the API when one is present.
+
+        :param retry_counter: Zero-based index of the attempt that failed
+        :param retry_after: Value of the Retry-After response header, if any
+        :return: Number of seconds to sleep before retrying
+        """
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**retry_counter) * (
+            1 + random.uniform(0, RETRY_JITTER)
+        )
+
     def parse_response(self, response: requests.models.Response):
         """Parse Response will return JSON from response object.
 
@@ -282,15 +347,44 @@ class AzureSentinelClient:
 
             self.logger.debug(debuglog_msg)
             for retry_counter in range(MAX_RETRIES):
-                response = requests.request(
-                    url=url,
-                    method=method,
-                    params=params,
-                    data=data,
-                    headers=headers,
-                    verify=verify,
-                    proxies=proxies,
-                )
+                try:
+                    response = self.session.request(
+                        url=url,
+                        method=method,
+                        params=params,
+                        data=data,
+                        headers=headers,
+                        verify=verify,
+                        proxies=proxies,
+                        timeout=self.timeout,
+                    )
+                except (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                ) as error:
+                    if (
+                        isinstance(error, requests.exceptions.ProxyError)
+                        or is_validation
+                        or retry_counter == MAX_RETRIES - 1
+                    ):
+                        raise
+                    delay = self._get_retry_delay(retry_counter)
+                    self.logger.error(
+                        message=(
+                            "{}: Error occurred while {}. Retrying after "
+                            "{} seconds. {} retries remaining. "
+                            "Error: {}".format(
+                                self.log_prefix,
+                                logger_msg,
+                                round(delay, 2),
+                                MAX_RETRIES - 1 - retry_counter,
+                                error,
+                            )
+                        ),
+                        details=str(traceback.format_exc()),
+                    )
+                    time.sleep(delay)
+                    continue
                 self.logger.debug(
                     f"{self.log_prefix} : Received API Response while "
                     f"{logger_msg}. Method={method}, "
@@ -316,6 +410,10 @@ class AzureSentinelClient:
                             details=str(response.text),
                         )
                         raise AzureSentinelException(err_msg)
+                    retry_after = None
+                    if response.status_code in {429, 503}:
+                        retry_after = response.headers.get("Retry-After")
+                    delay = self._get_retry_delay(retry_counter, retry_after)
                     self.logger.error(
                         message=(
                             "{}: Received exit code {}, while {}. "
@@ -324,13 +422,13 @@ class AzureSentinelClient:
                                 self.log_prefix,
                                 response.status_code,
                                 logger_msg,
-                                RETRY_SLEEP_TIME,
+                                round(delay, 2),
                                 MAX_RETRIES - 1 - retry_counter,
                             )
                         ),
                         details=str(response.text),
                     )
-                    time.sleep(RETRY_SLEEP_TIME)
+                    time.sleep(delay)
                 else:
                     return self.handle_error(response, logger_msg, is_validation)
 
@@ -386,21 +484,25 @@ class AzureSentinelClient:
             log_type = self.configuration.get("events_log_type_name").strip()
 
         try:
-            workspace_id = self.configuration.get("workspace_id").strip()
+            workspace_id = self.workspace_id
             shared_key = self.configuration.get("primary_key")
             result = []
 
-            size_in_bytes = sys.getsizeof(json.dumps(data))
-            size_in_mb = size_in_bytes / (1024.0**2)  # Convert bytes to megabytes
+            # Encode each record once and derive every split decision
+            # from the actual encoded lengths instead of re-serializing
+            # the payload for each size check. sys.getsizeof measured the
+            # Python string object overhead, not the wire size.
+            item_sizes = [len(json.dumps(item)) for item in data]
+            size_in_mb = sum(item_sizes) / (1024.0**2)
             if size_in_mb > TARGET_SIZE_MB:
                 for item in range(0, len(data), BATCH_SIZE):
                     current_part = data[item : item + BATCH_SIZE]
-                    size_in_bytes = sys.getsizeof(json.dumps(current_part))
-                    size_in_mb = size_in_bytes / (
-                        1024.0**2
-                    )  # Convert bytes to megabytes
+                    part_sizes = item_sizes[item : item + BATCH_SIZE]
+                    size_in_mb = sum(part_sizes) / (1024.0**2)
                     if size_in_mb > TARGET_SIZE_MB:
-                        chunk_data = split_into_size(current_part)
+                        chunk_data = split_into_size(
+                            current_part, part_sizes
+                        )
                         result.extend(chunk_data)
                     else:
                         result.append(current_part)
@@ -411,41 +513,38 @@ class AzureSentinelClient:
                 "%a, %d %b %Y %H:%M:%S GMT"
             )
 
-            uri = API_BASE_URL.format(workspace_id, RESOURCE)
+            uri = self.ingest_uri
             headers = {
                 "Content-Type": CONTENT_TYPE,
                 "Log-Type": log_type,
                 "x-ms-date": rfc1123date,
             }
             headers = self._add_user_agent(headers)
-            page = 0
-            for result_data in result:
-                get_payload_size = sys.getsizeof(json.dumps(result_data))
-                size_in_mb_payload = get_payload_size / (1024.0**2)
-                page += 1
-                content_length = len(json.dumps(result_data))
+
+            def _ingest_page(page, result_data):
+                # Serialize the page exactly once and reuse the encoded
+                # body for the signature, the size logs and the request
+                # itself.
+                body = json.dumps(result_data)
+                content_length = len(body)
+                size_in_mb_payload = content_length / (1024.0**2)
                 signature = self._build_signature(
                     workspace_id, shared_key, rfc1123date, content_length
                 )
-                try:
-                    headers["Authorization"] = signature
-                    msg = ""
-                    if not is_validation:
-                        msg = f" for page {page}, content-size: {content_length}, size of payload: {get_payload_size} Bytes, size of payload: {size_in_mb_payload} MB, Number of records: {len(result_data)}"
-                    self.api_helper(
-                        logger_msg + msg,
-                        uri,
-                        "POST",
-                        data=json.dumps(result_data),
-                        headers=headers,
-                        verify=self.verify_ssl,
-                        proxies=self.proxy,
-                        is_validation=is_validation,
-                    )
-                except Exception:
-                    skipped_count += len(result_data)
-                    continue
-                total_count += len(result_data)
+                page_headers = {**headers, "Authorization": signature}
+                msg = ""
+                if not is_validation:
+                    msg = f" for page {page}, content-size: {content_length} Bytes, size of payload: {size_in_mb_payload} MB, Number of records: {len(result_data)}"
+                self.api_helper(
+                    logger_msg + msg,
+                    uri,
+                    "POST",
+                    data=body,
+                    headers=page_headers,
+                    verify=self.verify_ssl,
+                    proxies=self.proxy,
+                    is_validation=is_validation,
+                )
                 if not is_validation:
                     log_msg = "[{}]:[{}] Successfully ingested {} {}(s) for page {} to {}.".format(
                         data_type,
@@ -456,6 +555,35 @@ class AzureSentinelClient:
                         self.plugin_name,
                     )
                     self.logger.info(f"{self.log_prefix}: {log_msg}")
+                return len(result_data)
+
+            if not is_validation and len(result) > 1:
+                # The per-page POSTs are independent and I/O bound, so
+                # dispatch them concurrently over the shared connection
+                # pool instead of blocking on each round-trip in turn.
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_CONCURRENT_PAGES, len(result))
+                ) as executor:
+                    futures = {
+                        executor.submit(
+                            _ingest_page, page, result_data
+                        ): result_data
+                        for page, result_data in enumerate(result, start=1)
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            total_count += future.result()
+                        except Exception:
+                            skipped_count += len(futures[future])
+            else:
+                for page, result_data in enumerate(result, start=1):
+                    if is_validation:
+                        total_count += _ingest_page(page, result_data)
+                        continue
+                    try:
+                        total_count += _ingest_page(page, result_data)
+                    except Exception:
+                        skipped_count += len(result_data)
 
             if not is_validation:
                 log_msg = "[{}]:[{}] Successfully ingested {} {}(s) to {}.".format(
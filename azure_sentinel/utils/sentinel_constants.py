@@ -38,7 +38,13 @@ CONTENT_TYPE = "application/json"
 RESOURCE = "/api/logs"
 API_BASE_URL = "https://{}.ods.opinsights.azure.com{}?api-version=2016-04-01"
 MAX_RETRIES = 3
-RETRY_SLEEP_TIME = 60
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30
+RETRY_JITTER = 0.5
+CONNECTION_POOL_SIZE = 32
+MAX_CONCURRENT_PAGES = 5
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 60
 ATTRIBUTE_DTYPE_MAP = {
     "dlp_incident_id": "string",
     "app_session_id": "string",
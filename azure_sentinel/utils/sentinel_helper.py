@@ -32,7 +32,6 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 Microsoft Azure Sentinel Helper.
 """
 
-import sys
 import json
 from datetime import datetime
 
@@ -95,22 +94,27 @@ def get_sentinel_mappings(mappings, data_type):
     return mappings
 
 
-def split_into_size(data_list):
+def split_into_size(data_list, item_sizes=None):
     """
     Split a list into parts, each approximately with a target size in MB.
 
     Parameters:
     - data_list: The list of data to be split.
+    - item_sizes: Optional list of encoded byte lengths for each item,
+    used to avoid re-serializing items the caller has already measured.
 
     Returns:
     A list of parts, each with a total size approximately equal to the target size.
     """
+    if item_sizes is None:
+        item_sizes = [len(json.dumps(item)) for item in data_list]
+
     result = []
     current_part = []
     current_size_mb = 0
 
-    for item in data_list:
-        item_size_mb = sys.getsizeof(json.dumps(item)) / (1024**2)  # Convert bytes to MB
+    for item, item_size in zip(data_list, item_sizes):
+        item_size_mb = item_size / (1024**2)  # Convert bytes to MB
         if current_size_mb + item_size_mb <= TARGET_SIZE_MB:
             current_part.append(item)
             current_size_mb += item_size_mb
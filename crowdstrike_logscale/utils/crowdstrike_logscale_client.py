@@ -33,9 +33,11 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """CrowdStrike LogScale Client."""
 
 
+import gzip
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from enum import Enum
 import traceback
 import uuid
@@ -43,7 +45,13 @@ import sys
 
 from .crowdstrike_logscale_helper import _add_user_agent
 from .crowdstrike_logscale_exception import CrowdStrikeLogScaleException
-from .crowdstrike_logscale_constant import MAX_RETRY_COUNT, PLATFORM_NAME
+from .crowdstrike_logscale_constant import (
+    MAX_RETRY_COUNT,
+    PLATFORM_NAME,
+    COMPRESS_THRESHOLD_BYTES,
+    COMPRESS_LEVEL,
+    CONNECTION_POOL_SIZE,
+)
 
 
 class DataTypes(Enum):
@@ -75,6 +83,18 @@ class CrowdStrikeLogScaleClient:
         else:
             self.verify_ssl = False
 
+        # One session with a small connection pool so the per-chunk
+        # POSTs of a push cycle reuse a warm keep-alive connection
+        # instead of opening a new TCP+TLS connection per chunk.
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=CONNECTION_POOL_SIZE,
+                pool_maxsize=CONNECTION_POOL_SIZE,
+            ),
+        )
+
     def chunks(self, lst):
         """Yield successive n-sized chunks from lst."""
         chunk_size = 500
@@ -109,9 +129,15 @@ class CrowdStrikeLogScaleClient:
             start = time.time()
             for chunk in self.chunks(payload):
                 chunk_size = len(chunk)
-                payload_str = ""
                 payload_list = [json.dumps({"event": single_event}) for single_event in chunk]
-                payload_str = "\n".join(payload_list)
+                body = "\n".join(payload_list).encode("utf-8")
+                body_size = len(body)
+                chunk_headers = headers
+                if body_size > COMPRESS_THRESHOLD_BYTES:
+                    # JSON event batches compress well; trade a little
+                    # CPU for far fewer bytes on the wire.
+                    body = gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+                    chunk_headers = {**headers, "Content-Encoding": "gzip"}
                 batch_start = time.time()
                 self.logger.debug(
                     f"{self.log_prefix}: [{self.data_type}] [{self.subtype}]"
@@ -120,16 +146,17 @@ class CrowdStrikeLogScaleClient:
                     f"Proxy: {self.proxy}. UUID: {uid}"
                 )
                 self._api_helper(
-                    lambda: requests.post(
+                    lambda body=body, chunk_headers=chunk_headers: self.session.post(
                         url=uri,
-                        headers=headers,
-                        data=payload_str,
+                        headers=chunk_headers,
+                        data=body,
                         proxies=self.proxy,
                     ),
                     (
                         f" [{self.data_type}] [{self.subtype}] ingesting data "
                         f"into CrowdStrike LogScale having UUID: {uid}"
                     ),
+                    parse_json=False,
                 )
                 batch_end = time.time()
                 count += chunk_size
@@ -142,7 +169,7 @@ class CrowdStrikeLogScaleClient:
                         self.data_type,
                         self.subtype,
                         chunk_size,
-                        round(len(json.dumps(chunk))/1024, 2),
+                        round(body_size / 1024, 2),
                         PLATFORM_NAME,
                         count,
                         chunk_size,
@@ -172,14 +199,20 @@ class CrowdStrikeLogScaleClient:
             )
             return
 
-    def handle_error(self, response, logger_msg):
+    def handle_error(self, response, logger_msg, parse_json=True):
         """Handle API Status code errors.
 
         Args:
             response (Requests response object): Response object of requests.
+            logger_msg: logger message.
+            parse_json (bool): Whether the caller needs the decoded JSON
+            body on success. Ingestion discards it, so the decode can be
+            skipped on the hot path.
         """
 
         if response.status_code == 200:
+            if not parse_json or not response.content:
+                return {}
             return response.json()
         elif response.status_code in [401, 403]:
             err_msg = (
@@ -224,7 +257,13 @@ class CrowdStrikeLogScaleClient:
         )
         self._post_data(data, uid)
 
-    def _api_helper(self, request, logger_msg, is_handle_error_required=True):
+    def _api_helper(
+        self,
+        request,
+        logger_msg,
+        is_handle_error_required=True,
+        parse_json=True,
+    ):
         """Helper function for api call."""
 
         try:
@@ -326,7 +365,7 @@ class CrowdStrikeLogScaleClient:
 
                 else:
                     return (
-                        self.handle_error(response, logger_msg)
+                        self.handle_error(response, logger_msg, parse_json)
                         if is_handle_error_required
                         else response
                     )
@@ -38,6 +38,9 @@ PLATFORM_NAME = "CrowdStrike LogScale"
 MODULE_NAME = "CLS"
 PLUGIN_VERSION = "1.0.0"
 MAX_RETRY_COUNT = 4
+COMPRESS_THRESHOLD_BYTES = 4096
+COMPRESS_LEVEL = 1
+CONNECTION_POOL_SIZE = 8
 
 SEVERITY_LOW = "Low"
 SEVERITY_MEDIUM = "Medium"
@@ -29,7 +29,7 @@ class RequestsHelper:
         :param kwargs: Additional args to be sent to the request
         :return: Dict of response body or original :class:`requests.Response`
         """
-        session = kwargs.get("session", requests.Session())
+        session = kwargs.pop("session", None) or requests.Session()
         log.debug(
             "sending a %s request to %s with args: %s kwargs: %s",
             method.upper(),
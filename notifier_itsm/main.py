@@ -38,8 +38,9 @@ import os
 import traceback
 import uuid
 from typing import List, Dict, Tuple
-from functools import partial
+from functools import lru_cache, partial
 import requests
+from requests.adapters import HTTPAdapter
 
 from netskope.integrations.itsm.plugin_base import (
     PluginBase,
@@ -58,6 +59,11 @@ from .lib.notifiers import get_notifier
 from .lib.notifiers.exceptions import BadArguments
 from .lib.notifiers.utils import requests as notifier_requests
 
+# Keep references to the unpatched notifier request functions so that
+# re-instantiating the plugin never stacks wrappers on top of wrappers.
+_notifier_get = notifier_requests.get
+_notifier_post = notifier_requests.post
+
 
 MAPPED_FIELDS = {
     "email": ["message", "subject", "to_"],
@@ -117,11 +123,168 @@ EXCLUDED_FIELDS = {
     "zulip": [],
 }
 
+# Frozenset copies of the field lists above for O(1) membership checks
+# in the field-building loops; the lists are kept for ordered iteration.
+MAPPED_FIELDS_SETS = {
+    platform: frozenset(fields) for platform, fields in MAPPED_FIELDS.items()
+}
+
+PASSWORD_FIELDS_SETS = {
+    platform: frozenset(fields) for platform, fields in PASSWORD_FIELDS.items()
+}
+
+EXCLUDED_FIELDS_SETS = {
+    platform: frozenset(fields) for platform, fields in EXCLUDED_FIELDS.items()
+}
+
+_EMPTY = frozenset()
+
 MODULE_NAME = "CTO"
 PLUGIN_NAME = "Notifier"
 PLUGIN_VERSION = "1.1.0"
 
 
+@lru_cache(maxsize=1)
+def _load_manifest() -> Tuple:
+    """Read plugin name and version from manifest.json.
+
+    The manifest is immutable at runtime, so it is parsed only once per
+    process instead of on every plugin instantiation.
+
+    Returns:
+        tuple: Tuple of plugin's name and version fetched from manifest.
+    """
+    file_path = os.path.join(
+        str(os.path.dirname(os.path.abspath(__file__))),
+        "manifest.json",
+    )
+    with open(file_path, "r") as manifest:
+        manifest_json = json.load(manifest)
+        return (
+            manifest_json.get("name", PLUGIN_NAME),
+            manifest_json.get("version", PLUGIN_VERSION),
+        )
+
+
+_BOOL_MAP = {"boolean_true": True, "boolean_false": False}
+
+# Built field lists per platform; the argument schema of a notifier
+# class never changes at runtime, so the UI can be served from cache.
+_FIELDS_CACHE = {}
+
+
+@lru_cache(maxsize=32)
+def _get_notifier_arguments(platform: str) -> dict:
+    """Return the argument schema for a notifier platform.
+
+    The schema is immutable per notifier class, so it is resolved once
+    per platform and served from cache on subsequent UI calls.
+    """
+    notifier = get_notifier(platform)
+    if notifier is None:
+        raise ValueError("Notifier not found.")
+    return notifier.arguments
+
+
+@lru_cache(maxsize=32)
+def _get_default_field_mappings(platform: str) -> tuple:
+    """Build the default field mappings for a notifier platform."""
+    return tuple(
+        FieldMapping(
+            extracted_field="custom_message",
+            custom_message="$user",
+            destination_field=field,
+        )
+        if field == "to_"
+        else FieldMapping(
+            extracted_field="custom_message",
+            custom_message="",
+            destination_field=field,
+        )
+        for field in MAPPED_FIELDS.get(platform, [])
+    )
+
+
+@lru_cache(maxsize=256)
+def _humanize(key: str) -> str:
+    """Convert a snake_case argument key to a display label."""
+    return " ".join(key.split("_")).title()
+
+
+def _build_string_field(key, val, platform):
+    """Build a UI field for a string argument."""
+    if "enum" in val:
+        return {
+            "label": _humanize(key),
+            "key": key,
+            "type": "choice",
+            "description": f"({key}) {val.get('title', '')}",
+            "choices": [
+                {"key": choice.title(), "value": choice}
+                for choice in val.get("enum", [])
+            ],
+            "default": val.get("enum")[0] if val.get("enum", []) else "",
+        }
+    return {
+        "label": _humanize(key),
+        "key": key,
+        "type": "password"
+        if key in PASSWORD_FIELDS_SETS.get(platform, _EMPTY)
+        else "text",
+        "description": f"({key}) {val.get('title', '')}",
+    }
+
+
+def _build_integer_field(key, val, platform):
+    """Build a UI field for an integer argument."""
+    return {
+        "label": _humanize(key),
+        "key": key,
+        "type": "number",
+        "description": f"({key}) {val.get('title', '')}",
+    }
+
+
+def _build_boolean_field(key, val, platform):
+    """Build a UI field for a boolean argument."""
+    return {
+        "label": _humanize(key),
+        "key": key,
+        "type": "choice",
+        "choices": [
+            {"key": "Yes", "value": "boolean_true"},
+            {"key": "No", "value": "boolean_false"},
+        ],
+        "default": "boolean_true",
+        "description": f"({key}) {val.get('title', '')}",
+    }
+
+
+def _build_oneof_field(key, val, platform):
+    """Build a UI field for a oneOf argument, if it has a string variant."""
+    string_fields = [
+        variant
+        for variant in val.get("oneOf", [])
+        if variant.get("type") == "string"
+    ]
+    if not string_fields:
+        return None
+    string_field = string_fields.pop()
+    return {
+        "label": _humanize(key),
+        "key": key,
+        "type": "text",
+        "description": f"({key}) {string_field.get('title', '')}",
+    }
+
+
+_FIELD_BUILDERS = {
+    "string": _build_string_field,
+    "integer": _build_integer_field,
+    "boolean": _build_boolean_field,
+}
+
+
 class NotifierPlugin(PluginBase):
     """Jira plugin implementation."""
 
@@ -143,6 +306,16 @@ class NotifierPlugin(PluginBase):
         )
         self.plugin_name, self.plugin_version = self._get_plugin_info()
         self.log_prefix = f"Debug: {MODULE_NAME} {self.plugin_name} [{name}]"
+        # Route all notifier traffic through one pooled session carrying
+        # the configured proxies, instead of re-wrapping the module-level
+        # request functions with functools.partial on every create_task.
+        self._session = requests.Session()
+        self._session.proxies = self.proxy or {}
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        )
+        notifier_requests.get = partial(_notifier_get, session=self._session)
+        notifier_requests.post = partial(_notifier_post, session=self._session)
 
     def _get_plugin_info(self) -> Tuple:
         """Get plugin name and version from manifest.
@@ -151,15 +324,7 @@ class NotifierPlugin(PluginBase):
             tuple: Tuple of plugin's name and version fetched from manifest.
         """
         try:
-            file_path = os.path.join(
-                str(os.path.dirname(os.path.abspath(__file__))),
-                "manifest.json",
-            )
-            with open(file_path, "r") as manifest:
-                manifest_json = json.load(manifest)
-                plugin_name = manifest_json.get("name", PLUGIN_NAME)
-                plugin_version = manifest_json.get("version", PLUGIN_VERSION)
-                return (plugin_name, plugin_version)
+            return _load_manifest()
         except Exception as exp:
             self.logger.error(
                 message=(
@@ -175,9 +340,7 @@ class NotifierPlugin(PluginBase):
     def _get_notifier(self, configuration):
         """Get notifier object from configuration."""
         platform = configuration.get("platform").get("name")
-        self.logger.info(f"{self.log_prefix}: Inside get notifier method.")
         notifier = get_notifier(platform)
-        self.logger.info(f'{self.log_prefix}: Notifier object "{notifier}"')
         if notifier is None:
             self.logger.error(
                 f"{self.log_prefix}: Notifier value is {notifier} i.e. Notifier not found."
@@ -185,59 +348,14 @@ class NotifierPlugin(PluginBase):
             raise ValueError("Notifier not found.")
         return notifier
 
-    def _remove_empties(self, data):
-        """Remove empty values from dictionary."""
-        self.logger.info(
-            f"{self.log_prefix}: Inside removed empties method. Data: {data}"
-        )
-        new_dict = {}
-        for key, value in data.items():
-            if type(value) is str:
-                if value.strip() != "":
-                    new_dict[key] = value
-            elif type(value) in [int, bool]:
-                new_dict[key] = value
-        self.logger.info(
-            f"{self.log_prefix}: Successfully removed empty values from data. Final data: {new_dict}"
-        )
-        return new_dict
-
     def create_task(self, alert: Alert, mappings: Dict, queue: Queue) -> Task:
         """Create an issue/ticket on Jira platform."""
-        self.logger.info(f"{self.log_prefix}: Inside create task method.")
         notifier = self._get_notifier(self.configuration)
-        self.logger.info(
-            "{}: Successfully fetch notifier object. {}".format(
-                self.log_prefix, notifier
-            )
-        )
         params = {**self.configuration.get("params"), **mappings}
-        self.logger.info(f"{self.log_prefix}: Params: {params}")
         filtered_args = self._get_args_from_params(params)
-        self.logger.info(f"{self.log_prefix}: filtered args: {filtered_args}")
-        notifier_requests.get = partial(
-            notifier_requests.get, proxies=self.proxy
-        )
-        self.logger.info(
-            f"{self.log_prefix}: Notifier_request.get {notifier_requests.get}"
-        )
-        notifier_requests.post = partial(
-            notifier_requests.post, proxies=self.proxy
-        )
-        self.logger.info(
-            "{}: Notifier_request.post {}".format(
-                self.log_prefix, notifier_requests.post
-            )
-        )
-        requests.get = partial(requests.get, proxies=self.proxy)
-        requests.post = partial(requests.post, proxies=self.proxy)
-        self.logger.info(f"{self.log_prefix}: Calling notify method.")
         response = notifier.notify(
             **filtered_args, logger=self.logger, log_prefix=self.log_prefix
         )
-        self.logger.info(
-            f"{self.log_prefix}: Response for notify method: {response}"
-        )
         response.raise_on_errors()
         if response.ok:
             self.logger.info(
@@ -258,65 +376,36 @@ class NotifierPlugin(PluginBase):
         return task
 
     def _get_args_from_params(self, params: dict) -> dict:
-        """Get dictionary that can be unpacked and used as argument."""
-        self.logger.info(
-            f"{self.log_prefix}: Inside _get_args_from_params. Params: {params}."
-        )
+        """Get dictionary that can be unpacked and used as argument.
+
+        Maps the boolean sentinel strings to real booleans and drops
+        empty values in a single pass over the params.
+        """
         new_dict = {}
         for key, value in params.items():
-            if value == "boolean_true":
-                new_dict[key] = True
-            elif value == "boolean_false":
-                new_dict[key] = False
-            else:
+            if isinstance(value, str):
+                value = _BOOL_MAP.get(value, value)
+                if isinstance(value, bool) or value.strip():
+                    new_dict[key] = value
+            elif isinstance(value, (int, bool)):
                 new_dict[key] = value
-        self.logger.info(
-            "{}: Calling _remove_empties with new dict: {}".format(
-                self.log_prefix, new_dict
-            )
-        )
-        return self._remove_empties(new_dict)
+        return new_dict
 
     def validate_step(
         self, name: str, configuration: dict
     ) -> ValidationResult:
         """Validate a given configuration step."""
-        self.logger.info(
-            "{}: Inside validate step method. Name: {} "
-            "Configuration: {}".format(self.log_prefix, name, configuration)
-        )
         if name != "params":
-            self.logger.info(
-                "{}: name {} is params hence returning "
-                "validation success".format(self.log_prefix, name)
-            )
             return ValidationResult(
                 success=True, message="Validation successful."
             )
 
         platform = configuration.get("platform").get("name")
-        self.logger.info(f"{self.log_prefix}: Calling get_notifier method.")
         notifier = self._get_notifier(configuration)
-        self.logger.info(
-            f"{self.log_prefix}: Successfully got notifier object. {notifier}."
-        )
         mapped_fields = {key: "" for key in MAPPED_FIELDS.get(platform, [])}
-        self.logger.info(f"{self.log_prefix}: Mapped fields: {mapped_fields}")
-        self.logger.info(f"{self.log_prefix}: Calling _get_args_from_params")
         args = self._get_args_from_params(configuration.get("params", {}))
-        self.logger.info(
-            "{}: args returned by _get_args_from_params method. {}".format(
-                self.log_prefix, args
-            )
-        )
         args = {**args, **mapped_fields}
-        self.logger.info(f"{self.log_prefix}: Final args {args}")
         try:
-            self.logger.info(
-                "{}: Calling notifier.validate_data with args: {}".format(
-                    self.log_prefix, args
-                )
-            )
             notifier._validate_data(args)
         except BadArguments as ex:
             self.logger.error(
@@ -330,17 +419,9 @@ class NotifierPlugin(PluginBase):
 
     def get_available_fields(self, configuration: dict) -> List[MappingField]:
         """Get list of all the mappable fields."""
-        self.logger.info(
-            f"{self.log_prefix}: Inside get_available_fields method."
-        )
         platform = configuration.get("platform").get("name")
-        self.logger.info(
-            "{}: Calling _get_notifier method with configuration: {}".format(
-                self.log_prefix, configuration
-            )
-        )
-        notifier = self._get_notifier(configuration)
-        args = notifier.arguments
+        args = _get_notifier_arguments(platform)
+        mapped = MAPPED_FIELDS_SETS.get(platform, _EMPTY)
         fields = []
         keys = set()
         for key, val in args.items():
@@ -348,13 +429,11 @@ class NotifierPlugin(PluginBase):
                 continue
             if key in keys:
                 continue
-            if key not in MAPPED_FIELDS.get(platform, []):
+            if key not in mapped:
                 continue
             keys.add(key)
-            fields.append(
-                MappingField(label=" ".join(key.split("_")).title(), value=key)
-            )
-        self.logger.info(f"{self.log_prefix}: Final fields: {fields}")
+            fields.append(MappingField(label=_humanize(key), value=key))
+        self.logger.debug(f"{self.log_prefix}: Final fields: {fields}")
         return fields
 
     def get_default_mappings(
@@ -363,23 +442,10 @@ class NotifierPlugin(PluginBase):
         """Get default mappings."""
         platform = configuration.get("platform").get("name")
         mapping = {
-            "mappings": [
-                FieldMapping(
-                    extracted_field="custom_message",
-                    custom_message="$user",
-                    destination_field=field,
-                )
-                if field == "to_"
-                else FieldMapping(
-                    extracted_field="custom_message",
-                    custom_message="",
-                    destination_field=field,
-                )
-                for field in MAPPED_FIELDS.get(platform, [])
-            ],
+            "mappings": list(_get_default_field_mappings(platform)),
             "dedup": [],
         }
-        self.logger.info(
+        self.logger.debug(
             "{}: Mappings returned by get_default_mappings {}".format(
                 self.log_prefix, mapping
             )
@@ -388,20 +454,14 @@ class NotifierPlugin(PluginBase):
 
     def get_fields(self, name: str, configuration: dict):
         """Get available fields."""
-        self.logger.info(
-            "{}: Inside get_fields method with configuration: {}".format(
-                self.log_prefix, configuration
-            )
-        )
         if name == "params":
             platform = configuration.get("platform").get("name")
-            self.logger.info(
-                "{}: Calling _get_notifier with configuration: {}".format(
-                    self.log_prefix, configuration
-                )
-            )
-            notifier = self._get_notifier(configuration)
-            args = notifier.arguments
+            cached_fields = _FIELDS_CACHE.get(platform)
+            if cached_fields is not None:
+                return cached_fields
+            args = _get_notifier_arguments(platform)
+            mapped = MAPPED_FIELDS_SETS.get(platform, _EMPTY)
+            excluded = EXCLUDED_FIELDS_SETS.get(platform, _EMPTY)
             fields = []
             keys = set()
             for key, val in args.items():
@@ -409,80 +469,23 @@ class NotifierPlugin(PluginBase):
                     continue
                 if key in keys:
                     continue
-                if key in MAPPED_FIELDS.get(
-                    platform, []
-                ) or key in EXCLUDED_FIELDS.get(platform, []):
+                if key in mapped or key in excluded:
                     continue
                 keys.add(key)
-                if val.get("type") == "string":
-                    if "enum" in val:
-                        field = {
-                            "label": " ".join(key.split("_")).title(),
-                            "key": key,
-                            "type": "choice",
-                            "description": f"({key}) {val.get('title', '')}",
-                            "choices": [
-                                {"key": key.title(), "value": key}
-                                for key in val.get("enum", [])
-                            ],
-                            "default": val.get("enum")[0]
-                            if val.get("enum", [])
-                            else "",
-                        }
-                    else:
-                        field = {
-                            "label": " ".join(key.split("_")).title(),
-                            "key": key,
-                            "type": "password"
-                            if key in PASSWORD_FIELDS.get(platform, [])
-                            else "text",
-                            "description": f"({key}) {val.get('title', '')}",
-                        }
-                    fields.append(field)
-                elif val.get("type") == "integer":
-                    field = {
-                        "label": " ".join(key.split("_")).title(),
-                        "key": key,
-                        "type": "number",
-                        "description": f"({key}) {val.get('title', '')}",
-                    }
-                    fields.append(field)
-                elif val.get("oneOf") is not None:
-                    string_fields = list(
-                        filter(
-                            lambda x: x.get("type") == "string",
-                            val.get("oneOf", []),
-                        )
-                    )
-                    if not string_fields:
+                builder = _FIELD_BUILDERS.get(val.get("type"))
+                if builder is None:
+                    if val.get("oneOf") is None:
                         continue
-                    string_field = string_fields.pop()
-                    fields.append(
-                        {
-                            "label": " ".join(key.split("_")).title(),
-                            "key": key,
-                            "type": "text",
-                            "description": f"({key}) {string_field.get('title', '')}",
-                        }
-                    )
-                elif val.get("type") == "boolean":
-                    field = {
-                        "label": " ".join(key.split("_")).title(),
-                        "key": key,
-                        "type": "choice",
-                        "choices": [
-                            {"key": "Yes", "value": "boolean_true"},
-                            {"key": "No", "value": "boolean_false"},
-                        ],
-                        "default": "boolean_true",
-                        "description": f"({key}) {val.get('title', '')}",
-                    }
+                    builder = _build_oneof_field
+                field = builder(key, val, platform)
+                if field is not None:
                     fields.append(field)
-            self.logger.info(
+            self.logger.debug(
                 "{}: Fields to be return by get_fields are fields {}".format(
                     self.log_prefix, fields
                 )
             )
+            _FIELDS_CACHE[platform] = fields
             return fields
         else:
             raise NotImplementedError()